@@ -0,0 +1,77 @@
+"""Calculator page-load time and Chrome memory per session: lean browser profile against default.
+
+Starts one driver per profile, loads the calculator n times, then sums the
+resident memory of the chromedriver process tree (Linux /proc only). Needs
+Chrome and a chromedriver, like the agent itself.
+
+Usage: python benchmarks/bench_browser_profile.py [n_loads]
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent import CALCULATOR_URL, GhanaTaxAgent
+from scraper import PageReadiness
+
+
+def process_tree_rss(root_pid):
+    """Summed VmRSS in bytes of root_pid and all its descendants, or None without /proc"""
+    if not os.path.isdir("/proc"):
+        return None
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total, pending = 0, [root_pid]
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+        except OSError:
+            continue
+    return total
+
+
+def measure(profile, n):
+    agent = GhanaTaxAgent(result_cache=False, incremental_reports=False, browser_profile=profile)
+    with agent.pool:
+        start = time.perf_counter()
+        driver = agent._setup_driver()
+        startup = time.perf_counter() - start
+        readiness = PageReadiness(driver)
+        loads = []
+        for _ in range(n):
+            start = time.perf_counter()
+            readiness.load(CALCULATOR_URL)
+            readiness.wait_for_inputs()
+            loads.append(time.perf_counter() - start)
+        rss = process_tree_rss(driver.service.process.pid)
+    return startup, loads, rss
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"{n} calculator loads per profile")
+    for profile in ("default", "lean"):
+        startup, loads, rss = measure(profile, n)
+        memory = f"{rss / 2**20:7.1f} MiB" if rss is not None else "    n/a"
+        print(f"{profile:>8}: startup {startup:5.2f}s  load median {statistics.median(loads):5.2f}s "
+              f"(min {min(loads):5.2f}s)  Chrome RSS {memory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Throughput of the vectorized net income estimate against the scalar loop.
+
+Usage: python benchmarks/bench_estimate.py [n_rows]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent import GhanaTaxAgent
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = np.random.default_rng(0)
+    salary = rng.uniform(0, 40000, n).round(2)
+    allowances = rng.uniform(0, 5000, n).round(2)
+    tax_relief = rng.uniform(0, 1000, n).round(2)
+
+    agent = GhanaTaxAgent()
+
+    start = time.perf_counter()
+    scalar = [
+        agent._estimate_net_income({"salary": s, "allowances": a, "tax_relief": r})
+        for s, a, r in zip(salary.tolist(), allowances.tolist(), tax_relief.tolist())
+    ]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = agent.estimate_net_income_batch(salary, allowances, tax_relief)
+    batch_time = time.perf_counter() - start
+
+    assert np.array_equal(np.asarray(scalar, dtype=np.float64), batch["net_income"])
+
+    print(f"rows:   {n:,}")
+    print(f"scalar: {scalar_time:.3f}s ({n / scalar_time:,.0f} rows/s)")
+    print(f"batch:  {batch_time:.3f}s ({n / batch_time:,.0f} rows/s)")
+    print(f"speedup: {scalar_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
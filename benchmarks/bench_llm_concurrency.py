@@ -0,0 +1,51 @@
+"""Budget generation throughput against a local fake chat-completions server.
+
+Sweeps request concurrency, then prompt batch size (K incomes per request)
+at a fixed concurrency, reporting requests sent and prompt characters.
+
+Usage: python benchmarks/bench_llm_concurrency.py [n_budgets] [latency_seconds]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent import GhanaTaxAgent
+from benchmarks.fake_openai import FakeOpenAIServer
+
+
+def run_once(server, n, concurrency, batch_size):
+    agent = GhanaTaxAgent(llm_api_key="fake", llm_base_url=server.url, llm_concurrency=concurrency,
+                          llm_batch_size=batch_size, result_cache=False, budget_cache=False)
+    states = [agent._initial_state({"id": i, "salary": 3000 + 50 * i, "allowances": 0, "tax_relief": 0})
+              for i in range(n)]
+    for state in states:
+        state["net_income"] = agent._estimate_net_income(state)
+
+    requests, prompt_chars = server.requests, server.prompt_chars
+    start = time.perf_counter()
+    agent.generate_budgets(states)
+    elapsed = time.perf_counter() - start
+    return elapsed, server.requests - requests, server.prompt_chars - prompt_chars
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+
+    with FakeOpenAIServer(latency=latency) as server:
+        print(f"{n} budgets, {latency * 1000:.0f} ms simulated latency")
+        for concurrency in (1, 2, 4, 8, 16, 32):
+            elapsed, _, _ = run_once(server, n, concurrency, 1)
+            print(f"concurrency {concurrency:>3}: {elapsed:6.2f}s  {n / elapsed:7.1f} budgets/s")
+
+        print("\nbatch size at concurrency 8")
+        for batch_size in (1, 2, 4, 8, 16):
+            elapsed, requests, prompt_chars = run_once(server, n, 8, batch_size)
+            print(f"K={batch_size:>3}: {elapsed:6.2f}s  {n / elapsed:7.1f} budgets/s  "
+                  f"{requests:>4} requests  {prompt_chars / n:7.0f} prompt chars/budget")
+
+
+if __name__ == "__main__":
+    main()
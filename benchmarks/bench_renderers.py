@@ -0,0 +1,55 @@
+"""Speed and memory of the canvas report renderer against the platypus one.
+
+Reports throughput over n synthetic states, then the mean peak Python
+allocation (tracemalloc) while rendering a single report.
+
+Usage: python benchmarks/bench_renderers.py [n_reports]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_reports import synthetic_states
+from reports import get_renderer
+
+
+def throughput(renderer, states, out_dir):
+    start = time.perf_counter()
+    for state in states:
+        renderer.render(state, os.path.join(out_dir, f"budget_case{state['scenario_id']}.pdf"))
+    return time.perf_counter() - start
+
+
+def peak_memory(renderer, states, out_dir):
+    peaks = []
+    for state in states:
+        tracemalloc.start()
+        renderer.render(state, os.path.join(out_dir, "peak.pdf"))
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return sum(peaks) / len(peaks)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    states = synthetic_states(n)
+
+    print(f"reports: {n:,}")
+    results = {}
+    with tempfile.TemporaryDirectory() as out_dir:
+        for name in ("platypus", "canvas"):
+            renderer = get_renderer(name)
+            renderer.render(states[0], os.path.join(out_dir, "warmup.pdf"))
+            elapsed = throughput(renderer, states, out_dir)
+            peak = peak_memory(renderer, states[:200], out_dir)
+            results[name] = elapsed
+            print(f"{name:>9}: {elapsed:6.2f}s ({n / elapsed:7,.0f} reports/s)  peak {peak / 1024:7.1f} KiB/report")
+    print(f"speedup: {results['platypus'] / results['canvas']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Report rendering throughput: a template rebuilt per report against the shared one.
+
+"per-report" prepares the stylesheet and table styles for every report, the
+way create_pdf used to; "shared" reuses one ReportTemplate.
+
+Usage: python benchmarks/bench_reports.py [n_reports]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent import GhanaTaxAgent
+from reports import ReportTemplate
+
+
+def synthetic_states(n):
+    agent = GhanaTaxAgent(result_cache=False)
+    rng = np.random.default_rng(0)
+    states = []
+    for i, salary in enumerate(rng.uniform(1000, 40000, n).round(2).tolist()):
+        state = agent._initial_state({"id": i, "salary": salary, "allowances": 500.0, "tax_relief": 100.0})
+        state["net_income"] = agent._estimate_net_income(state)
+        state["budget"] = agent._generate_fallback_budget(state["net_income"])
+        states.append(state)
+    return states
+
+
+def timed(states, out_dir, template_for):
+    start = time.perf_counter()
+    for state in states:
+        template_for().render(state, os.path.join(out_dir, f"budget_case{state['scenario_id']}.pdf"))
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    states = synthetic_states(n)
+    shared = ReportTemplate()
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        per_report = timed(states, out_dir, ReportTemplate)
+        reused = timed(states, out_dir, lambda: shared)
+
+    print(f"reports:    {n:,}")
+    print(f"per-report: {per_report:.2f}s ({n / per_report:,.0f} reports/s)")
+    print(f"shared:     {reused:.2f}s ({n / reused:,.0f} reports/s)")
+    print(f"speedup: {per_report / reused:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Minimal local stand-in for the OpenAI chat-completions endpoint.
+
+Answers every request with a fixed-shape budget after `latency` seconds, and
+fails a random `error_rate` share of requests with HTTP 500 so retries can be
+exercised. Streaming requests get server-sent chunks (tool-call arguments
+when tools are bound), and `corrupt_at` turns the output into garbage after
+that many characters. Point the agent at it with llm_base_url=server.url.
+"""
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SHARES = {
+    "Housing": 0.28, "Food & Groceries": 0.20, "Transport": 0.15, "Utilities": 0.08,
+    "Healthcare": 0.06, "Education/Skills": 0.08, "Savings/Emergency": 0.10, "Discretionary": 0.05,
+}
+
+
+def fake_budget(net_income: float) -> dict:
+    return {
+        "categories": [{"name": name, "amount": round(net_income * share, 2), "percentage": share * 100}
+                       for name, share in SHARES.items()],
+        "notes": "Synthetic budget from the local fake server.",
+    }
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class FakeOpenAIServer:
+    def __init__(self, latency: float = 0.2, error_rate: float = 0.0, port: int = 0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.requests = 0
+        self.prompt_chars = 0
+        self.chunk_chars = 16
+        self.chunk_delay = 0.0
+        self.corrupt_at = None
+        self.chars_streamed = 0
+        self.streams_aborted = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                server.requests += 1
+                server.prompt_chars += len(body["messages"][-1]["content"])
+                time.sleep(server.latency)
+                if random.random() < server.error_rate:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                prompt = body["messages"][-1]["content"]
+                try:
+                    content = server.respond(prompt)
+                except Exception:
+                    self.send_response(500)
+                    self.end_headers()
+                    raise
+                if server.corrupt_at is not None:
+                    content = content[:server.corrupt_at] + "<garbage>" * 200
+                if body.get("stream"):
+                    self._stream(body, content)
+                    return
+                payload = json.dumps({
+                    "id": "chatcmpl-fake", "object": "chat.completion", "created": int(time.time()),
+                    "model": body.get("model", "fake"),
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": content}}],
+                    "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4,
+                              "total_tokens": (len(prompt) + len(content)) // 4},
+                }).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _stream(self, body, content):
+                """Send content as server-sent chat.completion.chunk events, as tool-call arguments if tools were given"""
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                tools = body.get("tools")
+                try:
+                    for start in range(0, len(content), server.chunk_chars):
+                        fragment = content[start:start + server.chunk_chars]
+                        if tools:
+                            tool_call = {"index": 0, "function": {"arguments": fragment}}
+                            if start == 0:
+                                tool_call.update(id="call_fake", type="function")
+                                tool_call["function"]["name"] = tools[0]["function"]["name"]
+                            delta = {"role": "assistant", "content": None, "tool_calls": [tool_call]}
+                        else:
+                            delta = {"role": "assistant", "content": fragment}
+                        event = {"id": "chatcmpl-fake", "object": "chat.completion.chunk", "created": int(time.time()),
+                                 "model": body.get("model", "fake"),
+                                 "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+                        self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+                        self.wfile.flush()
+                        server.chars_streamed += len(fragment)
+                        time.sleep(server.chunk_delay)
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    server.streams_aborted += 1
+
+        self.httpd = _Server(("127.0.0.1", port), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def respond(self, prompt: str) -> str:
+        batch = re.findall(r"- scenario (\S+): GHS (\d+(?:\.\d+)?)", prompt)
+        if batch:
+            return json.dumps({"budgets": [{"scenario_id": scenario_id, **fake_budget(float(net_income))}
+                                           for scenario_id, net_income in batch]})
+        match = re.search(r"GHS\s*(\d+(?:\.\d+)?)", prompt)
+        return json.dumps(fake_budget(float(match.group(1)) if match else 0.0))
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,172 @@
+import json
+from typing import Any, Dict, List, Optional
+
+BUDGET_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "categories": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "amount": {"type": "number", "description": "Monthly amount in GHS"},
+                    "percentage": {"type": "number", "description": "Percentage of net income"},
+                },
+                "required": ["name", "amount", "percentage"],
+            },
+        },
+        "notes": {"type": "string", "description": "Brief advice about this budget (max 2 sentences)"},
+    },
+    "required": ["categories", "notes"],
+}
+
+BUDGET_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "submit_budget",
+        "description": "Submit the monthly budget",
+        "parameters": BUDGET_SCHEMA,
+    },
+}
+
+MAX_CATEGORIES = 20
+# Longest string (category name, notes, key) accepted before the stream is dropped
+MAX_STRING_LENGTH = 1000
+# Scalar characters that may appear outside strings: numbers and true/false/null
+_SCALAR_CHARS = set("0123456789+-.eE") | set("truefalsn")
+
+
+class MalformedBudget(ValueError):
+    pass
+
+
+class IncrementalBudgetParser:
+    """Validates a streamed budget JSON object as it arrives.
+
+    feed() scans each fragment once, tracking nesting and strings. It raises
+    MalformedBudget as soon as the text cannot become a valid budget:
+    structural garbage, a category missing its name or numeric amount, too
+    many categories, a string (category name or notes) longer than
+    `max_string_length`, or category amounts already exceeding the income by
+    more than `overspend`. The caller can then drop the stream instead of
+    paying for the rest of a bad generation.
+    """
+
+    def __init__(self, net_income: float, overspend: float = 0.10, max_categories: int = MAX_CATEGORIES,
+                 max_string_length: int = MAX_STRING_LENGTH):
+        self.net_income = net_income
+        self.overspend = overspend
+        self.max_categories = max_categories
+        self.max_string_length = max_string_length
+        self.categories: List[Dict[str, Any]] = []
+        self.total = 0.0
+        self._chunks: List[str] = []
+        self._length = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_key: Optional[str] = None
+        self._pending_string: Optional[str] = None
+        self._in_categories = False
+        self._category_start: Optional[int] = None
+        self._started = False
+        self._finished = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    def feed(self, fragment: str):
+        if not fragment:
+            return
+        base = self._length
+        self._chunks.append(fragment)
+        self._length += len(fragment)
+        for offset, char in enumerate(fragment):
+            self._scan(char, base + offset)
+
+    def _scan(self, char: str, position: int):
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if len(self._stack) == 1 and self._stack[-1] == "{":
+                    self._pending_string = self.text[self._string_start + 1:position]
+            elif position - self._string_start > self.max_string_length:
+                raise MalformedBudget(f"Budget string longer than {self.max_string_length} characters")
+            return
+
+        if char.isspace():
+            return
+        if self._finished:
+            raise MalformedBudget(f"Unexpected {char!r} after the budget object")
+        if not self._started:
+            if char != "{":
+                raise MalformedBudget(f"Budget must be a JSON object, got {char!r}")
+            self._started = True
+
+        if self._in_categories and len(self._stack) == 2 and char not in "{],":
+            raise MalformedBudget("Budget categories must be objects")
+
+        if char == '"':
+            self._in_string = True
+            self._string_start = position
+        elif char == ":":
+            if len(self._stack) == 1 and self._pending_string is not None:
+                self._last_key = self._pending_string
+            self._pending_string = None
+        elif char in "{[":
+            if len(self._stack) == 1 and char == "[" and self._last_key == "categories":
+                self._in_categories = True
+            elif self._in_categories and len(self._stack) == 2:
+                self._category_start = position
+            self._stack.append(char)
+        elif char in "}]":
+            expected = "{" if char == "}" else "["
+            if not self._stack or self._stack[-1] != expected:
+                raise MalformedBudget(f"Unbalanced {char!r} in budget JSON")
+            self._stack.pop()
+            if self._in_categories and len(self._stack) == 2 and char == "}":
+                self._check_category(self.text[self._category_start:position + 1])
+            elif self._in_categories and len(self._stack) == 1:
+                self._in_categories = False
+            if not self._stack:
+                self._finished = True
+        elif char == ",":
+            self._pending_string = None
+        elif char not in _SCALAR_CHARS:
+            raise MalformedBudget(f"Unexpected {char!r} in budget JSON")
+
+    def _check_category(self, text: str):
+        try:
+            category = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise MalformedBudget(f"Invalid budget category JSON: {e.msg}")
+        if not isinstance(category.get("name"), str) or not isinstance(category.get("amount"), (int, float)):
+            raise MalformedBudget(f"Budget category needs a name and numeric amount: {text}")
+        if category["amount"] < 0:
+            raise MalformedBudget(f"Negative amount for budget category {category['name']!r}")
+        self.categories.append(category)
+        self.total += category["amount"]
+        if len(self.categories) > self.max_categories:
+            raise MalformedBudget(f"More than {self.max_categories} budget categories")
+        if self.net_income > 0 and self.total > self.net_income * (1 + self.overspend):
+            raise MalformedBudget(f"Budget categories already total GHS {self.total:,.2f}, "
+                                  f"over the net income of GHS {self.net_income:,.2f}")
+
+    def result(self) -> Dict[str, Any]:
+        """The complete budget object; raises MalformedBudget if the stream ended early"""
+        if not self._finished:
+            raise MalformedBudget("Budget JSON ended before the object was closed")
+        try:
+            return json.loads(self.text)
+        except json.JSONDecodeError as e:
+            raise MalformedBudget(f"Invalid budget JSON: {e.msg}")
+
+
+__all__ = ["BUDGET_SCHEMA", "BUDGET_TOOL", "IncrementalBudgetParser", "MalformedBudget"]
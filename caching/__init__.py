@@ -0,0 +1,5 @@
+from caching.base import SQLiteCache
+from caching.budgets import BudgetCache
+from caching.results import NetIncomeCache
+
+__all__ = ["SQLiteCache", "NetIncomeCache", "BudgetCache"]
@@ -0,0 +1,56 @@
+import hashlib
+import json
+import math
+from typing import Any, Dict, Optional
+
+from caching.base import SQLiteCache
+
+
+class BudgetCache(SQLiteCache):
+    """Persistent cache of LLM budgets shared by every net income in the same band.
+
+    Keys combine the model, a hash of the prompt template and the income band
+    (net_income // band_width). Budgets are stored as category shares of the
+    income they were generated for, so a hit can be rescaled to any income in
+    the band.
+    """
+
+    table = "budgets"
+
+    def __init__(self, path: str, model: str, prompt_template: str, band_width: float = 250.0,
+                 ttl: Optional[float] = None, max_entries: int = 10_000):
+        if band_width <= 0:
+            raise ValueError("band_width must be positive")
+        super().__init__(path, ttl=ttl, max_entries=max_entries)
+        self.model = model
+        self.prompt_hash = hashlib.sha256(prompt_template.encode("utf-8")).hexdigest()[:16]
+        self.band_width = band_width
+
+    def key(self, net_income: float) -> str:
+        band = math.floor(net_income / self.band_width)
+        return f"{self.model}|{self.prompt_hash}|{self.band_width:g}|{band}"
+
+    def get(self, net_income: float) -> Optional[Dict[str, Any]]:
+        """Budget for net_income rescaled from its band's cached shares, or None on a miss"""
+        if net_income <= 0:
+            return None
+        raw = self._get(self.key(net_income))
+        if raw is None:
+            return None
+        cached = json.loads(raw)
+        return {
+            "categories": [{"name": category["name"], "amount": round(category["share"] * net_income, 2)}
+                           for category in cached["categories"]],
+            "notes": cached["notes"],
+        }
+
+    def put(self, net_income: float, budget: Dict[str, Any]):
+        """Store budget's category shares for net_income's band; budgets without amounts are skipped"""
+        if net_income <= 0 or not all(isinstance(c.get("amount"), (int, float)) for c in budget["categories"]):
+            return
+        shares = {
+            "categories": [{"name": category["name"], "share": category["amount"] / net_income}
+                           for category in budget["categories"]],
+            "notes": budget.get("notes", ""),
+        }
+        self._put(self.key(net_income), json.dumps(shares))
@@ -0,0 +1,28 @@
+from typing import Optional
+
+from caching.base import SQLiteCache
+
+
+class NetIncomeCache(SQLiteCache):
+    """Persistent cache of scraped net incomes keyed by normalized scenario inputs.
+
+    Keys carry a tax-table version tag so a new tax year never serves stale
+    figures.
+    """
+
+    table = "net_income"
+
+    def __init__(self, path: str, version: str, ttl: Optional[float] = None, max_entries: int = 100_000):
+        super().__init__(path, ttl=ttl, max_entries=max_entries)
+        self.version = version
+
+    def key(self, salary: float, allowances: float, tax_relief: float, version: Optional[str] = None) -> str:
+        return f"{version or self.version}|{float(salary):.2f}|{float(allowances):.2f}|{float(tax_relief):.2f}"
+
+    def get(self, salary: float, allowances: float, tax_relief: float, version: Optional[str] = None) -> Optional[float]:
+        """Cached net income for the inputs, or None on a miss or expired entry"""
+        return self._get(self.key(salary, allowances, tax_relief, version))
+
+    def put(self, salary: float, allowances: float, tax_relief: float, net_income: float,
+            version: Optional[str] = None):
+        self._put(self.key(salary, allowances, tax_relief, version), float(net_income))
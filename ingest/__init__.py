@@ -0,0 +1,144 @@
+import csv
+import gzip
+import io
+import json
+import math
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from logger import logger
+from tax_tables import versions
+
+REQUIRED_FIELDS = ("salary",)
+NUMERIC_FIELDS = ("salary", "allowances", "tax_relief")
+
+
+class MalformedRow(ValueError):
+    def __init__(self, line_no: int, reason: str, raw: Any = None):
+        super().__init__(f"line {line_no}: {reason}")
+        self.line_no = line_no
+        self.reason = reason
+        self.raw = raw
+
+
+def _open_text(path: str) -> io.TextIOBase:
+    """Open a plain or gzip-compressed text file for streaming reads"""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def _detect_format(path: str) -> str:
+    name = path[:-3] if path.endswith(".gz") else path
+    ext = os.path.splitext(name)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Unsupported scenario file type: {path}")
+
+
+def _scenario_id(value: Any) -> Any:
+    """Integral ids ("7", 7, 7.0) become ints; anything else is kept as-is rather than truncated"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _normalize(record: Dict[str, Any], line_no: int) -> Dict[str, Any]:
+    """Turn a raw CSV/JSONL record into a scenario dict accepted by process_scenario"""
+    if not isinstance(record, dict):
+        raise MalformedRow(line_no, "row is not an object", record)
+
+    for field in REQUIRED_FIELDS:
+        if record.get(field) in (None, ""):
+            raise MalformedRow(line_no, f"missing '{field}'", record)
+
+    scenario = {}
+    for field in NUMERIC_FIELDS:
+        value = record.get(field)
+        if value in (None, ""):
+            value = 0
+        try:
+            number = float(str(value).replace(",", ""))
+        except (TypeError, ValueError):
+            raise MalformedRow(line_no, f"'{field}' is not a number: {value!r}", record)
+        if not math.isfinite(number) or number < 0:
+            raise MalformedRow(line_no, f"'{field}' must be a finite non-negative number", record)
+        scenario[field] = number
+
+    scenario_id = record.get("id")
+    scenario["id"] = line_no if scenario_id in (None, "") else _scenario_id(scenario_id)
+
+    tax_table = record.get("tax_table")
+    if tax_table not in (None, ""):
+        tax_table = str(tax_table).strip()
+        if tax_table not in versions():
+            raise MalformedRow(line_no, f"unknown 'tax_table' {tax_table!r} (expected one of {', '.join(versions())})",
+                               record)
+        scenario["tax_table"] = tax_table
+
+    for key, value in record.items():
+        if key not in scenario and key is not None:
+            scenario[key] = value
+    return scenario
+
+
+def _iter_records(path: str, fmt: str) -> Iterator[Any]:
+    """Yield (line_no, record or exception) pairs without loading the file into memory"""
+    with _open_text(path) as handle:
+        if fmt == "csv":
+            reader = csv.DictReader(handle)
+            for record in reader:
+                line_no = reader.line_num
+                if None in record:
+                    yield line_no, MalformedRow(line_no, "too many columns", record)
+                    continue
+                yield line_no, record
+        else:
+            for line_no, line in enumerate(handle, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_no, MalformedRow(line_no, f"invalid JSON: {e.msg}", line)
+
+
+def iter_scenarios(path: str, on_error: Optional[Callable[[MalformedRow], None]] = None) -> Iterator[Dict[str, Any]]:
+    """Lazily read scenarios from a CSV or JSONL file (optionally .gz).
+
+    Malformed rows are logged and passed to on_error; the stream carries on.
+    """
+    fmt = _detect_format(path)
+    for line_no, record in _iter_records(path, fmt):
+        try:
+            if isinstance(record, MalformedRow):
+                raise record
+            yield _normalize(record, line_no)
+        except MalformedRow as e:
+            logger.error(f"Skipping malformed row in {path}: {e}")
+            if on_error:
+                on_error(e)
+
+
+def iter_scenario_chunks(path: str, chunk_size: int = 500,
+                         on_error: Optional[Callable[[MalformedRow], None]] = None) -> Iterator[List[Dict[str, Any]]]:
+    """Group iter_scenarios output into lists of at most chunk_size scenarios"""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    chunk = []
+    for scenario in iter_scenarios(path, on_error=on_error):
+        chunk.append(scenario)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
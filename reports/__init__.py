@@ -0,0 +1,32 @@
+import importlib
+
+from reports.constants import RENDERERS, TEMPLATE_VERSION
+
+# Exported name -> defining module; submodules (and reportlab) are imported on first access
+_EXPORTS = {
+    "ReportArchive": "reports.archive",
+    "ReportBook": "reports.book",
+    "CanvasReport": "reports.canvas",
+    "BuildManifest": "reports.manifest",
+    "report_digest": "reports.manifest",
+    "RenderPool": "reports.pool",
+    "get_renderer": "reports.render",
+    "render_report": "reports.render",
+    "render_report_bytes": "reports.render",
+    "report_path": "reports.render",
+    "ReportTemplate": "reports.template",
+    "default_template": "reports.template",
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'reports' has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = ["ReportArchive", "ReportBook", "CanvasReport", "BuildManifest", "report_digest", "RenderPool",
+           "RENDERERS", "get_renderer", "render_report", "render_report_bytes", "report_path",
+           "TEMPLATE_VERSION", "ReportTemplate", "default_template"]
@@ -0,0 +1,74 @@
+import os
+import tarfile
+import threading
+import time
+import zipfile
+from io import BytesIO
+from typing import Any, Dict, Optional
+
+from logger import logger
+from reports.render import render_report_bytes
+
+
+class ReportArchive:
+    """Renders reports in memory and streams them into one zip or tar archive.
+
+    The format follows the path's extension: .zip, .tar, .tar.gz/.tgz. PDFs are
+    already compressed, so zip members are stored. add() may be called from
+    several threads; the archive is created on the first one.
+    """
+
+    def __init__(self, path: str, renderer: str = "platypus"):
+        self.path = path
+        self.renderer = renderer
+        self.reports = 0
+        self.bytes_written = 0
+        self._lock = threading.Lock()
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._tar: Optional[tarfile.TarFile] = None
+
+        if not path.endswith((".zip", ".tar", ".tar.gz", ".tgz")):
+            raise ValueError(f"Unsupported report archive format: {path} (use .zip, .tar or .tar.gz)")
+
+    def _open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        if self.path.endswith(".zip"):
+            self._zip = zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_STORED)
+        else:
+            self._tar = tarfile.open(self.path, "w" if self.path.endswith(".tar") else "w:gz")
+
+    def add(self, state: Dict[str, Any]) -> str:
+        """Render the scenario's report and append it; return its archive path"""
+        name = f"budget_case{state['scenario_id']}.pdf"
+        data = render_report_bytes(state, renderer=self.renderer)
+        with self._lock:
+            if self._zip is None and self._tar is None:
+                self._open()
+            if self._zip is not None:
+                self._zip.writestr(name, data)
+            else:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = int(time.time())
+                self._tar.addfile(info, BytesIO(data))
+            self.reports += 1
+            self.bytes_written += len(data)
+        return os.path.join(self.path, name)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"reports": self.reports, "bytes": self.bytes_written, "path": self.path}
+
+    def close(self):
+        """Finish the archive"""
+        with self._lock:
+            archive, self._zip, self._tar = self._zip or self._tar, None, None
+            if archive is not None:
+                archive.close()
+                logger.info(f"Report archive written: {self.path} ({self.reports} reports)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,93 @@
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen.canvas import Canvas
+
+from logger import logger
+from reports.render import get_renderer
+
+
+class ReportBook:
+    """Appends every report as pages of a few sharded PDFs with one outline entry per scenario.
+
+    A shard holds at most `shard_size` reports; reportlab keeps a shard's pages
+    in memory until it is saved, so memory is bounded by the shard size rather
+    than by the number of reports. Shards are named {prefix}_0001.pdf, ... in
+    `directory`; shards left there by an earlier run are removed when the first
+    shard opens, so a shorter run never leaves stale higher-numbered shards.
+    add() may be called from several threads.
+    """
+
+    def __init__(self, directory: str, shard_size: int = 1000, renderer: str = "canvas",
+                 prefix: str = "budget_book", pagesize=letter):
+        if shard_size < 1:
+            raise ValueError("ReportBook shard_size must be at least 1")
+        self.directory = directory
+        self.shard_size = shard_size
+        self.renderer = get_renderer(renderer)
+        self.prefix = prefix
+        self.pagesize = pagesize
+        self.paths: List[str] = []
+        self.reports = 0
+        self._canvas: Optional[Canvas] = None
+        self._in_shard = 0
+        self._lock = threading.Lock()
+
+    def add(self, state: Dict[str, Any]) -> str:
+        """Append the scenario's report and return the path of the shard it went into"""
+        with self._lock:
+            if self._canvas is None:
+                self._open_shard()
+            key = f"case{state['scenario_id']}"
+            self._canvas.bookmarkPage(key)
+            self._canvas.addOutlineEntry(f"Case {state['scenario_id']}", key, level=0)
+            self.renderer.draw(self._canvas, state)
+            self.reports += 1
+            self._in_shard += 1
+            path = self.paths[-1]
+            if self._in_shard >= self.shard_size:
+                self._close_shard()
+            return path
+
+    def _remove_stale_shards(self):
+        shard = re.compile(rf"{re.escape(self.prefix)}_\d{{4,}}\.pdf")
+        stale = [name for name in os.listdir(self.directory) if shard.fullmatch(name)]
+        for name in stale:
+            os.remove(os.path.join(self.directory, name))
+        if stale:
+            logger.info(f"Removed {len(stale)} report book shards from an earlier run in {self.directory}")
+
+    def _open_shard(self):
+        os.makedirs(self.directory, exist_ok=True)
+        if not self.paths:
+            self._remove_stale_shards()
+        path = os.path.join(self.directory, f"{self.prefix}_{len(self.paths) + 1:04d}.pdf")
+        self._canvas = Canvas(path, pagesize=self.pagesize)
+        self._canvas.setTitle(f"Ghana Tax & Budget Reports ({os.path.basename(path)})")
+        self._canvas.showOutline()
+        self.paths.append(path)
+        self._in_shard = 0
+
+    def _close_shard(self):
+        self._canvas.save()
+        logger.info(f"Report book shard written: {self.paths[-1]} ({self._in_shard} reports)")
+        self._canvas = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"reports": self.reports, "shards": len(self.paths), "shard_size": self.shard_size}
+
+    def close(self):
+        """Save the open shard, if any"""
+        with self._lock:
+            if self._canvas is not None:
+                self._close_shard()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,195 @@
+from datetime import datetime
+from typing import Any, Dict, List, Sequence
+
+from reportlab import rl_config
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+
+from reports.template import ReportTemplate, default_template
+
+# SimpleDocTemplate's frame: 1 inch margins plus 6pt frame padding
+FRAME_LEFT = inch + 6
+FRAME_BOTTOM = inch + 6
+HEADER_ROW_HEIGHT = 27
+ROW_HEIGHT = 18
+
+
+class CanvasReport:
+    """Draws the budget report straight onto a canvas at precomputed coordinates.
+
+    Matches ReportTemplate's one-page layout. Reports that would not fit on one
+    page, or whose notes need paragraph markup, are handed to `fallback`.
+    """
+
+    version = ReportTemplate.version
+
+    def __init__(self, pagesize=letter, fallback: ReportTemplate = None):
+        self.pagesize = pagesize
+        self.fallback = fallback
+        page_width, page_height = pagesize
+        self.frame_width = page_width - 2 * FRAME_LEFT
+        self.center_x = FRAME_LEFT + self.frame_width / 2
+
+        # Walk the fixed part of the page once, the way platypus stacks the flowables
+        y = page_height - FRAME_BOTTOM
+        y -= 22
+        self.title_y = y + 4
+        y -= 6 + 0.3*inch + 12
+        self.date_y = y + 2
+        y -= 0.3*inch + 12 + 18
+        self.params_heading_y = y + 4
+        y -= 6
+        self.params_top = y
+        y -= HEADER_ROW_HEIGHT + 5 * ROW_HEIGHT + 0.5*inch + 12 + 18
+        self.budget_heading_y = y + 4
+        self.budget_top = y - 6
+
+        self.params_widths = [3*inch, 2*inch]
+        self.budget_widths = [2.5*inch, 1.5*inch, 1.5*inch]
+        self.params_x = FRAME_LEFT + (self.frame_width - sum(self.params_widths)) / 2
+        self.budget_x = FRAME_LEFT + (self.frame_width - sum(self.budget_widths)) / 2
+        self.space_width = stringWidth(" ", "Helvetica", 10)
+        self.space_shrink = getattr(rl_config, "spaceShrinkage", 0) * self.space_width
+
+    def _wrap(self, text: str) -> List[List[Any]]:
+        """Break text into [words, width] lines the way Paragraph does, including its space shrinkage"""
+        lines = []
+        words, width = [], -self.space_width
+        for word in text.split():
+            word_width = stringWidth(word, "Helvetica", 10)
+            new_width = width + self.space_width + word_width
+            if words and new_width > self.frame_width + self.space_shrink * len(words):
+                lines.append([words, width])
+                words, width = [word], word_width
+            else:
+                words.append(word)
+                width = new_width
+        if words:
+            lines.append([words, width])
+        return lines
+
+    def _layout(self, state: Dict[str, Any]):
+        """Return (notes lines, budget table height, notes top) or None if the page would overflow"""
+        notes = state["budget"]["notes"]
+        if "<" in notes or "&" in notes:
+            return None
+        title = f"Ghana Tax & Budget Report - Case {state['scenario_id']}"
+        if stringWidth(title, "Helvetica-Bold", 18) > self.frame_width:
+            return None
+        lines = self._wrap(notes)
+        budget_height = HEADER_ROW_HEIGHT + ROW_HEIGHT * (len(state["budget"]["categories"]) + 2)
+        notes_top = self.budget_top - budget_height - 0.3*inch - 12 - 18 - 6
+        if notes_top - 12 * len(lines) < FRAME_BOTTOM:
+            return None
+        return lines, notes_top
+
+    def _table(self, c: Canvas, x: float, top: float, widths: Sequence[float], rows: List[List[str]],
+               header_size: int, aligns: Sequence[str], grid_rows: int, rule_below: bool = False):
+        total_width = sum(widths)
+        lefts = [x + sum(widths[:i]) for i in range(len(widths))]
+        bottoms = [top - HEADER_ROW_HEIGHT - ROW_HEIGHT * i for i in range(len(rows))]
+
+        c.setFillColor(colors.grey)
+        c.rect(x, bottoms[0], total_width, HEADER_ROW_HEIGHT, stroke=0, fill=1)
+        c.setFillColor(colors.whitesmoke)
+        c.setFont("Helvetica-Bold", header_size)
+        for left, text in zip(lefts, rows[0]):
+            c.drawString(left + 6, bottoms[0] + 24 - header_size, text)
+
+        c.setFillColor(colors.black)
+        c.setFont("Helvetica", 10)
+        for row, bottom in zip(rows[1:], bottoms[1:]):
+            for left, width, align, text in zip(lefts, widths, aligns, row):
+                if not text:
+                    continue
+                if align == "RIGHT":
+                    c.drawRightString(left + width - 6, bottom + 5, text)
+                elif align == "CENTER":
+                    c.drawCentredString(left + width / 2, bottom + 5, text)
+                else:
+                    c.drawString(left + 6, bottom + 5, text)
+
+        c.setStrokeColor(colors.black)
+        c.setLineCap(1)
+        c.setLineJoin(1)
+        c.setLineWidth(1)
+        grid_bottom = bottoms[grid_rows - 1]
+        c.line(x, top, x + total_width, top)
+        for bottom in bottoms[:grid_rows]:
+            c.line(x, bottom, x + total_width, bottom)
+        for left in lefts + [x + total_width]:
+            c.line(left, grid_bottom, left, top)
+        if rule_below:
+            c.setLineWidth(2)
+            c.line(x, bottoms[-1], x + total_width, bottoms[-1])
+
+    def render(self, state: Dict[str, Any], file_path) -> Any:
+        """Draw the report for state into file_path (a path or binary file object)"""
+        layout = self._layout(state)
+        if layout is None:
+            return (self.fallback or default_template()).render(state, file_path)
+
+        c = Canvas(file_path, pagesize=self.pagesize)
+        self._draw_page(c, state, *layout)
+        c.save()
+        return file_path
+
+    def draw(self, c: Canvas, state: Dict[str, Any]):
+        """Draw the report onto an open canvas, ending its page"""
+        layout = self._layout(state)
+        if layout is None:
+            (self.fallback or default_template()).draw(c, state)
+        else:
+            self._draw_page(c, state, *layout)
+
+    def _draw_page(self, c: Canvas, state: Dict[str, Any], lines: List[List[Any]], notes_top: float):
+
+        c.setFillColor(colors.black)
+        c.setFont("Helvetica-Bold", 18)
+        c.drawCentredString(self.center_x, self.title_y, f"Ghana Tax & Budget Report - Case {state['scenario_id']}")
+        c.setFont("Helvetica", 10)
+        c.drawString(FRAME_LEFT, self.date_y, f"Generated: {datetime.now().strftime('%Y-%m-%d')}")
+
+        c.setFont("Helvetica-Bold", 14)
+        c.drawString(FRAME_LEFT, self.params_heading_y, "Input Parameters")
+        self._table(c, self.params_x, self.params_top, self.params_widths, [
+            ["Parameter", "Amount (GHS)"],
+            ["Monthly Basic Salary", f"{state['salary']:,.2f}"],
+            ["Monthly Allowances", f"{state['allowances']:,.2f}"],
+            ["Tax Relief", f"{state['tax_relief']:,.2f}"],
+            ["", ""],
+            ["Net Income (Take Home)", f"GHS {state['net_income']:,.2f}"]
+        ], header_size=12, aligns=("LEFT", "RIGHT"), grid_rows=6)
+
+        c.setFillColor(colors.black)
+        c.setFont("Helvetica-Bold", 14)
+        c.drawString(FRAME_LEFT, self.budget_heading_y, "Monthly Budget Allocation")
+        budget_rows = [["Category", "Amount (GHS)", "% of Income"]]
+        total = 0
+        for category in state["budget"]["categories"]:
+            budget_rows.append([
+                category["name"],
+                f"{category['amount']:,.2f}",
+                f"{category['percentage']:.1f}%"
+            ])
+            total += category['amount']
+        budget_rows.append(["", "", ""])
+        budget_rows.append(["Total", f"{total:,.2f}", f"{(total/state['net_income']*100):.1f}%"])
+        self._table(c, self.budget_x, self.budget_top, self.budget_widths, budget_rows,
+                    header_size=11, aligns=("LEFT", "RIGHT", "CENTER"), grid_rows=len(budget_rows) - 2,
+                    rule_below=True)
+
+        c.setFillColor(colors.black)
+        c.setFont("Helvetica-Bold", 14)
+        c.drawString(FRAME_LEFT, notes_top + 6 + 4, "Budget Notes")
+        text = c.beginText(FRAME_LEFT, notes_top - 10)
+        text.setFont("Helvetica", 10, 12)
+        for words, width in lines:
+            # Overfull lines are squeezed into the frame by tightening word spacing
+            text.setWordSpace((self.frame_width - width) / (len(words) - 1) if width > self.frame_width else 0)
+            text.textLine(" ".join(words))
+        c.drawText(text)
+        c.showPage()
@@ -0,0 +1,4 @@
+# Bump whenever the report layout changes
+TEMPLATE_VERSION = "1"
+
+RENDERERS = ("platypus", "canvas")
@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, List
+
+from logger import logger
+from reports.constants import TEMPLATE_VERSION
+
+# State fields that end up in a report
+REPORT_FIELDS = ("scenario_id", "salary", "allowances", "tax_relief", "net_income", "budget")
+
+
+def report_digest(state: Dict[str, Any], renderer: str = "platypus") -> str:
+    """Content hash of everything a report is rendered from"""
+    payload = {field: state.get(field) for field in REPORT_FIELDS}
+    payload["template"] = TEMPLATE_VERSION
+    payload["renderer"] = renderer
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class BuildManifest:
+    """Maps each report artifact to the content hash it was last built from.
+
+    A report is current when its file still exists and its hash matches, so
+    unchanged scenarios can skip rendering. The manifest is persisted as JSON
+    by save(); prune() deletes artifacts that the latest run no longer built.
+    """
+
+    def __init__(self, path: str, force: bool = False):
+        self.path = path
+        self.force = force
+        self.skipped = 0
+        self.built = 0
+        self.removed = 0
+        self._lock = threading.Lock()
+        self._digests: Dict[str, str] = {}
+        self._seen = set()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._digests = dict(json.load(f))
+        except (OSError, ValueError, TypeError) as e:
+            logger.error(f"Ignoring unreadable build manifest {self.path}: {e}")
+
+    def is_current(self, file_path: str, digest: str) -> bool:
+        """True if file_path was built from digest and can be reused (never when forced)"""
+        with self._lock:
+            self._seen.add(file_path)
+            current = (not self.force and self._digests.get(file_path) == digest
+                       and os.path.exists(file_path))
+            if current:
+                self.skipped += 1
+            return current
+
+    def record(self, file_path: str, digest: str):
+        """Record that file_path was just built from digest"""
+        with self._lock:
+            self._seen.add(file_path)
+            self._digests[file_path] = digest
+            self.built += 1
+
+    def prune(self) -> List[str]:
+        """Delete artifacts in the manifest that were not built or reused since it was loaded"""
+        with self._lock:
+            stale = [path for path in self._digests if path not in self._seen]
+            for path in stale:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.error(f"Could not remove stale report {path}: {e}")
+                    continue
+                del self._digests[path]
+                self.removed += 1
+        if stale:
+            logger.info(f"Removed {len(stale)} stale report(s)")
+        return stale
+
+    def save(self):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._digests, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"built": self.built, "skipped": self.skipped, "removed": self.removed}
@@ -0,0 +1,75 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from logger import logger
+from reports.render import render_report
+
+
+class RenderPool:
+    """Renders reports in worker processes with at most `max_in_flight` jobs pending.
+
+    submit() hands a plain-data state to a worker and returns the states whose
+    reports have finished so far, blocking only while the pool is full; drain()
+    waits for the rest. Each returned state has pdf_path set, or error on failure.
+    """
+
+    def __init__(self, workers: int = None, max_in_flight: int = None,
+                 render: Callable[[Dict[str, Any], str], str] = render_report):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or 2 * self.workers
+        if self.max_in_flight < 1:
+            raise ValueError("RenderPool max_in_flight must be at least 1")
+        self.render = render
+        self.rendered = 0
+        self.failed = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Dict[Future, Dict[str, Any]] = {}
+
+    def submit(self, state: Dict[str, Any], file_path: str) -> List[Dict[str, Any]]:
+        """Queue one report; return the states completed meanwhile"""
+        done = self._collect(block=len(self._pending) >= self.max_in_flight)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        future = self._executor.submit(self.render, dict(state), file_path)
+        self._pending[future] = state
+        return done
+
+    def drain(self) -> Iterator[Dict[str, Any]]:
+        """Yield the remaining states as their reports complete"""
+        while self._pending:
+            yield from self._collect(block=True)
+
+    def _collect(self, block: bool) -> List[Dict[str, Any]]:
+        if not self._pending:
+            return []
+        finished, _ = wait(self._pending, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        done = []
+        for future in finished:
+            state = self._pending.pop(future)
+            try:
+                state["pdf_path"] = future.result()
+                self.rendered += 1
+            except Exception as e:
+                self.failed += 1
+                state["error"] = f"Error creating PDF: {str(e)}"
+                logger.error(f"PDF rendering failed for scenario {state['scenario_id']}: {e}")
+            done.append(state)
+        return done
+
+    def stats(self) -> Dict[str, int]:
+        return {"workers": self.workers, "rendered": self.rendered, "failed": self.failed,
+                "in_flight": len(self._pending)}
+
+    def close(self):
+        """Wait for queued reports and shut the worker processes down"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,45 @@
+import os
+from functools import lru_cache
+from io import BytesIO
+from typing import Any, Dict
+
+from from_root import from_root
+
+from reports.constants import RENDERERS
+
+
+def report_path(scenario_id: Any, artifacts_dir: str = None) -> str:
+    """Return the artifact path of a scenario's report, creating the directory"""
+    artifacts_dir = artifacts_dir or os.path.join(from_root(), "artifacts")
+    os.makedirs(artifacts_dir, exist_ok=True)
+    return os.path.join(artifacts_dir, f"budget_case{scenario_id}.pdf")
+
+
+@lru_cache(maxsize=None)
+def get_renderer(name: str = "platypus"):
+    """Return the per-process renderer for name: the platypus ReportTemplate or the CanvasReport"""
+    # reportlab is only imported once a report is actually rendered
+    from reports.canvas import CanvasReport
+    from reports.template import default_template
+
+    if name == "platypus":
+        return default_template()
+    if name == "canvas":
+        return CanvasReport(fallback=default_template())
+    raise ValueError(f"Unknown report renderer {name!r}; expected one of {', '.join(RENDERERS)}")
+
+
+def render_report(state: Dict[str, Any], file_path: str, renderer: str = "platypus") -> str:
+    """Render the budget report for a scenario state to file_path.
+
+    Takes and returns plain data only, so it can run in a worker process; each
+    process prepares its renderer on its first report.
+    """
+    return get_renderer(renderer).render(state, file_path)
+
+
+def render_report_bytes(state: Dict[str, Any], renderer: str = "platypus") -> bytes:
+    """Render the budget report for a scenario state in memory and return the PDF bytes"""
+    buffer = BytesIO()
+    get_renderer(renderer).render(state, buffer)
+    return buffer.getvalue()
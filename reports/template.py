@@ -0,0 +1,140 @@
+from copy import copy
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Frame, LayoutError
+from reportlab.lib.units import inch
+
+from reports.constants import TEMPLATE_VERSION
+
+
+class ReportTemplate:
+    """The budget report layout, prepared once and stamped with each scenario's data.
+
+    Styles, table styles, column widths and the fixed headings are built in the
+    constructor; render() only creates the flowables that hold variable data.
+    """
+
+    version = TEMPLATE_VERSION
+
+    def __init__(self, pagesize=letter):
+        self.pagesize = pagesize
+        self.styles = getSampleStyleSheet()
+        self.params_widths = [3*inch, 2*inch]
+        self.budget_widths = [2.5*inch, 1.5*inch, 1.5*inch]
+        self.params_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ])
+        self.budget_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
+            ('ALIGN', (2, 1), (2, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('GRID', (0, 0), (-1, -3), 1, colors.black),
+            ('LINEBELOW', (0, -1), (-1, -1), 2, colors.black)
+        ])
+        self.small_gap = Spacer(1, 0.3*inch)
+        self.large_gap = Spacer(1, 0.5*inch)
+        self.params_heading = Paragraph("<b>Input Parameters</b>", self.styles['Heading2'])
+        self.budget_heading = Paragraph("<b>Monthly Budget Allocation</b>", self.styles['Heading2'])
+        self.notes_heading = Paragraph("<b>Budget Notes</b>", self.styles['Heading2'])
+        self._date_text = None
+        self._date = None
+
+    def _date_paragraph(self) -> Paragraph:
+        # Rebuilt only when the day changes
+        text = f"Generated: {datetime.now().strftime('%Y-%m-%d')}"
+        if text != self._date_text:
+            self._date_text = text
+            self._date = Paragraph(text, self.styles['Normal'])
+        return self._date
+
+    def flowables(self, state: Dict[str, Any]) -> List[Any]:
+        """The report's flowables for one scenario state"""
+        title = Paragraph(f"<b>Ghana Tax & Budget Report - Case {state['scenario_id']}</b>", self.styles['Title'])
+
+        params_data = [
+            ["Parameter", "Amount (GHS)"],
+            ["Monthly Basic Salary", f"{state['salary']:,.2f}"],
+            ["Monthly Allowances", f"{state['allowances']:,.2f}"],
+            ["Tax Relief", f"{state['tax_relief']:,.2f}"],
+            ["", ""],
+            ["Net Income (Take Home)", f"GHS {state['net_income']:,.2f}"]
+        ]
+        params_table = Table(params_data, colWidths=self.params_widths)
+        params_table.setStyle(self.params_style)
+
+        budget_data = [["Category", "Amount (GHS)", "% of Income"]]
+        total = 0
+        for category in state["budget"]["categories"]:
+            budget_data.append([
+                category["name"],
+                f"{category['amount']:,.2f}",
+                f"{category['percentage']:.1f}%"
+            ])
+            total += category['amount']
+        budget_data.append(["", "", ""])
+        budget_data.append(["Total", f"{total:,.2f}", f"{(total/state['net_income']*100):.1f}%"])
+
+        budget_table = Table(budget_data, colWidths=self.budget_widths)
+        budget_table.setStyle(self.budget_style)
+
+        # Shallow copies: doc.build marks flowables it had to postpone, which must not leak into the next report
+        return [
+            title, copy(self.small_gap),
+            copy(self._date_paragraph()), copy(self.small_gap),
+            copy(self.params_heading), params_table, copy(self.large_gap),
+            copy(self.budget_heading), budget_table, copy(self.small_gap),
+            copy(self.notes_heading), Paragraph(state["budget"]["notes"], self.styles['Normal']),
+        ]
+
+    def _frame(self) -> Frame:
+        # SimpleDocTemplate's default frame: the page less 1 inch margins
+        page_width, page_height = self.pagesize
+        return Frame(inch, inch, page_width - 2*inch, page_height - 2*inch)
+
+    def draw(self, canvas, state: Dict[str, Any]):
+        """Lay the report out onto an open canvas, ending each of its pages"""
+        flowables = self.flowables(state)
+        frame = self._frame()
+        while flowables:
+            flowable = flowables.pop(0)
+            if frame.add(flowable, canvas, trySplit=1):
+                continue
+            parts = frame.split(flowable, canvas)
+            if len(parts) > 1:
+                flowables[0:0] = parts
+            elif frame._atTop:
+                raise LayoutError(f"{flowable.identity()} is too large for the report page")
+            else:
+                canvas.showPage()
+                frame = self._frame()
+                flowables.insert(0, flowable)
+        canvas.showPage()
+
+    def render(self, state: Dict[str, Any], file_path) -> Any:
+        """Build the report for state into file_path (a path or binary file object)"""
+        doc = SimpleDocTemplate(file_path, pagesize=self.pagesize)
+        doc.build(self.flowables(state))
+        return file_path
+
+
+@lru_cache(maxsize=None)
+def default_template() -> ReportTemplate:
+    """The per-process shared ReportTemplate"""
+    return ReportTemplate()
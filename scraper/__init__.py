@@ -0,0 +1,9 @@
+from scraper.driver import DriverResolver
+from scraper.fastpath import fill_and_read
+from scraper.locators import By, LocatorCache
+from scraper.pool import DriverPool
+from scraper.profiles import BROWSER_PROFILES, apply_profile, chrome_options
+from scraper.readiness import DEFAULT_TIMEOUTS, PageReadiness, WaitStats
+
+__all__ = ["By", "DriverPool", "DriverResolver", "LocatorCache", "PageReadiness", "WaitStats", "DEFAULT_TIMEOUTS",
+           "BROWSER_PROFILES", "apply_profile", "chrome_options", "fill_and_read"]
@@ -0,0 +1,136 @@
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from logger import logger
+
+CHROME_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+MAC_CHROME = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+# Per-machine and per-user Chrome installs on Windows, relative to these environment folders
+WINDOWS_CHROME_ROOTS = ("PROGRAMFILES", "PROGRAMFILES(X86)", "LOCALAPPDATA")
+WINDOWS_CHROME = os.path.join("Google", "Chrome", "Application", "chrome.exe")
+
+
+def find_chrome() -> Optional[str]:
+    """Path of the installed Chrome/Chromium binary, if one can be found without launching it"""
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return os.path.realpath(path)
+    if sys.platform == "darwin" and os.path.exists(MAC_CHROME):
+        return MAC_CHROME
+    if sys.platform == "win32":
+        for root in filter(None, map(os.environ.get, WINDOWS_CHROME_ROOTS)):
+            path = os.path.join(root, WINDOWS_CHROME)
+            if os.path.isfile(path):
+                return path
+    return None
+
+
+def chrome_fingerprint() -> Optional[str]:
+    """Identifies the installed browser build by path, size and mtime; changes when Chrome is updated"""
+    path = find_chrome()
+    if path is None:
+        return None
+    stat = os.stat(path)
+    return f"{path}:{stat.st_size}:{int(stat.st_mtime)}"
+
+
+class DriverResolver:
+    """Finds the chromedriver binary once per process, without version probing when possible.
+
+    Order: a pinned `driver_path`; the binary recorded in the JSON cache at
+    `cache_path`, as long as it still exists and the installed Chrome has not
+    changed since; finally webdriver_manager (which may use the network), whose
+    result is cached for the next run. When Chrome cannot be found its changes
+    cannot be noticed, so the cache is only used offline. With offline=True the
+    last step is skipped and a missing driver is an error.
+    """
+
+    def __init__(self, driver_path: Optional[str] = None, cache_path: Optional[str] = None, offline: bool = False):
+        self.driver_path = driver_path
+        self.cache_path = cache_path
+        self.offline = offline
+        self.source: Optional[str] = None
+        self._resolved: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> str:
+        """Path of the chromedriver binary to launch"""
+        with self._lock:
+            if self._resolved is None:
+                self._resolved, self.source = self._resolve()
+                logger.info(f"Using chromedriver {self._resolved} ({self.source})")
+            return self._resolved
+
+    def _resolve(self):
+        if self.driver_path:
+            if not os.path.isfile(self.driver_path):
+                raise WebDriverException(f"Pinned chromedriver not found: {self.driver_path}")
+            return self.driver_path, "pinned"
+
+        fingerprint = chrome_fingerprint()
+        cached = self._load()
+        if cached.get("path") and os.path.isfile(cached["path"]):
+            if fingerprint is not None and cached.get("chrome") == fingerprint:
+                return cached["path"], "cached"
+            if fingerprint is None and self.offline:
+                logger.error("Installed Chrome not found; using the cached chromedriver unverified")
+                return cached["path"], "cached"
+
+        if self.offline:
+            raise WebDriverException("No cached chromedriver matches the installed Chrome and offline mode "
+                                     "forbids downloading one; pin one with --chromedriver")
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+        self._save({"path": path, "chrome": fingerprint, "resolved_at": time.time()})
+        return path, "webdriver_manager"
+
+    def invalidate(self, path: str) -> bool:
+        """Forget `path` after it failed to start a session; True if resolve() is worth retrying.
+
+        Only a cached resolution is dropped (from memory and from the cache file):
+        a pinned or freshly downloaded driver would fail the same way again.
+        """
+        with self._lock:
+            if self._resolved != path:
+                # Another worker already dropped it
+                return True
+            if self.source != "cached":
+                return False
+            logger.error(f"Cached chromedriver {path} could not start a session; resolving it again")
+            self._resolved, self.source = None, None
+            if self.cache_path and self._load().get("path") == path:
+                try:
+                    os.remove(self.cache_path)
+                except OSError as e:
+                    logger.error(f"Could not remove chromedriver cache {self.cache_path}: {e}")
+            return True
+
+    def _load(self) -> Dict[str, str]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return dict(json.load(f))
+        except (OSError, ValueError, TypeError) as e:
+            logger.error(f"Ignoring unreadable chromedriver cache {self.cache_path}: {e}")
+            return {}
+
+    def _save(self, entry: Dict[str, str]):
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.error(f"Could not persist chromedriver cache {self.cache_path}: {e}")
@@ -0,0 +1,103 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from scraper.readiness import DEFAULT_TIMEOUTS
+
+Locator = Tuple[str, str]
+
+# Runs entirely in the page: resolves each field from its locator list, sets the
+# values through the native input setter so framework bindings see the change,
+# dispatches input/change events and polls until the result text changes.
+FILL_AND_READ_SCRIPT = r"""
+const [fieldLocators, resultLocators, scenarios, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+
+function resolve(locators) {
+    for (const [by, value] of locators) {
+        let el = null;
+        try {
+            if (by === "css selector") el = document.querySelector(value);
+            else if (by === "id") el = document.getElementById(value);
+            else if (by === "class name") el = document.getElementsByClassName(value)[0] || null;
+            else if (by === "tag name") el = document.getElementsByTagName(value)[0] || null;
+            else if (by === "xpath") el = document.evaluate(value, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        } catch (e) {
+            el = null;
+        }
+        if (el) return el;
+    }
+    return null;
+}
+
+// Falls back to the page text so a recompute is still noticed, but flags that
+// the text did not come from a result locator
+function resultText() {
+    for (const locator of resultLocators) {
+        const el = resolve([locator]);
+        if (el && /\d/.test(el.textContent)) return {text: el.textContent, located: true};
+    }
+    return {text: document.body ? document.body.innerText : "", located: false};
+}
+
+const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+const inputs = {};
+for (const field of Object.keys(fieldLocators)) inputs[field] = resolve(fieldLocators[field]);
+
+const results = [];
+let index = 0;
+let lastKey = null;
+
+function next() {
+    if (index >= scenarios.length) { done(results); return; }
+    const scenario = scenarios[index++];
+    const before = resultText();
+    const key = JSON.stringify(scenario);
+    if (key === lastKey) {
+        // Same inputs as the previous scenario: the page will not recompute
+        results.push({text: before.text, located: before.located, missing: [], changed: false, wait_ms: 0});
+        setTimeout(next, 0);
+        return;
+    }
+    lastKey = key;
+    const missing = [];
+    for (const field of Object.keys(inputs)) {
+        const el = inputs[field];
+        if (!el) { missing.push(field); continue; }
+        setter.call(el, String(scenario[field]));
+        el.dispatchEvent(new Event("input", {bubbles: true}));
+        el.dispatchEvent(new Event("change", {bubbles: true}));
+    }
+    const start = performance.now();
+    (function poll() {
+        const {text, located} = resultText();
+        const elapsed = performance.now() - start;
+        if ((text && text !== before.text) || elapsed >= timeoutMs) {
+            results.push({text, located, missing, changed: text !== before.text, wait_ms: elapsed});
+            next();
+        } else {
+            setTimeout(poll, 10);
+        }
+    })();
+}
+next();
+"""
+
+
+def fill_and_read(driver, field_locators: Dict[str, Sequence[Locator]], result_locators: Sequence[Locator],
+                  scenarios: List[Dict[str, float]], result_timeout: Optional[float] = None) -> List[Dict]:
+    """Fill and read the calculator for every scenario in a single execute_async_script round trip.
+
+    Returns one dict per scenario with the raw result `text`, whether it was
+    `located` through a result locator (False means it is the whole page text),
+    the `missing` fields that could not be resolved, whether the result
+    `changed` and the in-page `wait_ms`.
+    """
+    timeout = DEFAULT_TIMEOUTS["result"] if result_timeout is None else result_timeout
+    driver.set_script_timeout(timeout * len(scenarios) + 5)
+    return driver.execute_async_script(
+        FILL_AND_READ_SCRIPT,
+        {field: [list(locator) for locator in locators] for field, locators in field_locators.items()},
+        [list(locator) for locator in result_locators],
+        [{field: scenario[field] for field in field_locators} for scenario in scenarios],
+        int(timeout * 1000),
+    )
@@ -0,0 +1,91 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from logger import logger
+
+Locator = Tuple[str, str]
+
+
+class By:
+    """selenium's locator strategies (the same strings), usable without importing selenium.webdriver"""
+
+    ID = "id"
+    XPATH = "xpath"
+    LINK_TEXT = "link text"
+    PARTIAL_LINK_TEXT = "partial link text"
+    NAME = "name"
+    TAG_NAME = "tag name"
+    CLASS_NAME = "class name"
+    CSS_SELECTOR = "css selector"
+
+
+class LocatorCache:
+    """Remembers which locator last worked for each form field and tries it first.
+
+    The mapping is persisted as JSON so later runs start warm; the full
+    candidate list is only re-probed when the cached locator fails.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._learned: Dict[str, Locator] = {}
+        self.hits = 0
+        self.misses = 0
+        self.lookups = 0
+        self.saved_lookups = 0
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._learned = {field: tuple(locator) for field, locator in data.items()}
+        except (OSError, ValueError, TypeError) as e:
+            logger.error(f"Ignoring unreadable locator cache {self.path}: {e}")
+
+    def _save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({field: list(locator) for field, locator in self._learned.items()}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def ordered(self, field: str, candidates: List[Locator]) -> List[Locator]:
+        """Candidates with the learned locator for field moved to the front"""
+        learned = self._learned.get(field)
+        if learned in candidates:
+            return [learned] + [c for c in candidates if c != learned]
+        return list(candidates)
+
+    def record(self, field: str, candidates: List[Locator], found: Optional[Locator], attempts: int):
+        """Record the outcome of one lookup that took `attempts` find_element calls"""
+        with self._lock:
+            self.lookups += attempts
+            learned = self._learned.get(field)
+            if found is not None and found == learned:
+                self.hits += 1
+                self.saved_lookups += candidates.index(found)
+                return
+            self.misses += 1
+            if found is not None:
+                self._learned[field] = found
+                try:
+                    self._save()
+                except OSError as e:
+                    logger.error(f"Could not persist locator cache {self.path}: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "lookups": self.lookups,
+                "saved_lookups": self.saved_lookups,
+            }
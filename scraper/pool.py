@@ -0,0 +1,89 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from logger import logger
+
+
+class DriverPool:
+    """Pool of N WebDriver sessions, each owned by exactly one worker thread.
+
+    Drivers are created lazily by `factory` the first time a worker asks for
+    one and are all quit by close(), which also runs on context-manager exit
+    so a failing batch never leaks Chrome processes.
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int = 1):
+        if size < 1:
+            raise ValueError("DriverPool size must be at least 1")
+        self.factory = factory
+        self.size = size
+        self._drivers: Dict[int, Any] = {}
+        self._sessions: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def current(self):
+        """Return the calling thread's driver, or None if it has not been created"""
+        return self._drivers.get(threading.get_ident())
+
+    def get(self):
+        """Return the calling thread's driver, creating it on first use"""
+        driver = self.current()
+        if driver is None:
+            driver = self.factory()
+            with self._lock:
+                self._drivers[threading.get_ident()] = driver
+            logger.info(f"Driver started for worker {threading.current_thread().name} ({len(self._drivers)}/{self.size})")
+        return driver
+
+    def session(self) -> Dict[str, Any]:
+        """Scratch state tied to the calling thread's driver; reset whenever the driver is"""
+        with self._lock:
+            return self._sessions.setdefault(threading.get_ident(), {})
+
+    def discard(self):
+        """Quit the calling thread's driver so the next get() starts a fresh session"""
+        with self._lock:
+            driver = self._drivers.pop(threading.get_ident(), None)
+            self._sessions.pop(threading.get_ident(), None)
+        self._quit(driver)
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[Any]:
+        """Apply fn to items across the pool's workers, yielding results in input order"""
+        if self.size == 1:
+            return map(fn, items)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="scraper")
+        return self._executor.map(fn, items)
+
+    def close(self):
+        """Quit every driver in the pool and stop its worker threads"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        with self._lock:
+            drivers = list(self._drivers.values())
+            self._drivers.clear()
+            self._sessions.clear()
+        for driver in drivers:
+            self._quit(driver)
+
+    @staticmethod
+    def _quit(driver):
+        if driver is None:
+            return
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.error(f"Failed to quit driver cleanly: {e}")
+
+    def __len__(self):
+        return len(self._drivers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
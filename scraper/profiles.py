@@ -0,0 +1,69 @@
+from typing import Any, Dict
+
+# Browser setups for the scraper. "default" is the original visible 1920x1080 session; "lean"
+# runs headless in a small window without extensions and blocks everything the
+# calculator's form and result do not need.
+BROWSER_PROFILES: Dict[str, Dict[str, Any]] = {
+    "default": {
+        "arguments": [
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+            "--window-size=1920,1080",
+        ],
+        "prefs": {},
+        "blocked_urls": [],
+    },
+    "lean": {
+        "arguments": [
+            "--headless=new",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+            "--window-size=800,600",
+            "--disable-extensions",
+            "--disable-component-extensions-with-background-pages",
+            "--disable-background-networking",
+            "--disable-sync",
+            "--mute-audio",
+            "--no-first-run",
+            "--blink-settings=imagesEnabled=false",
+        ],
+        "prefs": {"profile.managed_default_content_settings.images": 2},
+        "blocked_urls": [
+            "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+            "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+            "*.css",
+            "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+            "*facebook.net*", "*hotjar.com*",
+        ],
+    },
+}
+
+
+def _profile(name: str) -> Dict[str, Any]:
+    if name not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown browser profile {name!r}; expected one of {', '.join(BROWSER_PROFILES)}")
+    return BROWSER_PROFILES[name]
+
+
+def chrome_options(name: str = "default"):
+    """selenium ChromeOptions for the named profile"""
+    from selenium.webdriver.chrome.options import Options
+
+    profile = _profile(name)
+    options = Options()
+    for argument in profile["arguments"]:
+        options.add_argument(argument)
+    if profile["prefs"]:
+        options.add_experimental_option("prefs", profile["prefs"])
+    options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    return options
+
+
+def apply_profile(driver, name: str = "default"):
+    """Install the profile's request blocking on a started driver through the DevTools protocol"""
+    blocked = _profile(name)["blocked_urls"]
+    if blocked:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked})
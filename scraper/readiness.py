@@ -0,0 +1,111 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+
+from scraper.locators import By
+
+DEFAULT_TIMEOUTS = {
+    "inputs": 10.0,
+    "result": 5.0,
+}
+POLL_FREQUENCY = 0.05
+RESULTS_LOCATOR = (By.ID, "results")
+INPUT_LOCATOR = (By.CSS_SELECTOR, "form input")
+
+
+class WaitStats:
+    """Thread-safe totals of time spent waiting on each readiness step"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.timeouts: Dict[str, int] = {}
+
+    def record(self, step: str, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.totals[step] = self.totals.get(step, 0.0) + seconds
+            self.counts[step] = self.counts.get(step, 0) + 1
+            if timed_out:
+                self.timeouts[step] = self.timeouts.get(step, 0) + 1
+
+    def summary(self) -> str:
+        with self._lock:
+            parts = []
+            for step, total in self.totals.items():
+                count = self.counts[step]
+                parts.append(f"{step}: avg {total / count:.3f}s over {count} "
+                             f"({self.timeouts.get(step, 0)} timeouts)")
+        return "; ".join(parts) or "no waits recorded"
+
+
+class PageReadiness:
+    """Event-driven waits for the tax calculator page.
+
+    Each step blocks only until its expected condition holds (or its timeout
+    expires) and records the time actually spent in `timings`.
+    """
+
+    def __init__(self, driver, timeouts: Optional[Dict[str, float]] = None, stats: Optional[WaitStats] = None):
+        self.driver = driver
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.stats = stats
+        self.timings: Dict[str, float] = {}
+
+    def _wait(self, step: str, condition) -> bool:
+        """Wait for condition under the step's timeout; return False on timeout"""
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        wait = WebDriverWait(self.driver, self.timeouts[step], poll_frequency=POLL_FREQUENCY,
+                             ignored_exceptions=(StaleElementReferenceException,))
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            wait.until(condition)
+        except TimeoutException:
+            timed_out = True
+        elapsed = time.perf_counter() - start
+        self.timings[step] = elapsed
+        if self.stats:
+            self.stats.record(step, elapsed, timed_out)
+        return not timed_out
+
+    def load(self, url: str):
+        """Navigate to url, recording the blocking page load as the page_load step"""
+        start = time.perf_counter()
+        self.driver.get(url)
+        elapsed = time.perf_counter() - start
+        self.timings["page_load"] = elapsed
+        if self.stats:
+            self.stats.record("page_load", elapsed)
+
+    def is_loaded(self, url: str) -> bool:
+        """Whether the driver is still on url with the calculator inputs rendered"""
+        try:
+            return self.driver.current_url.startswith(url) and bool(self.driver.find_elements(*INPUT_LOCATOR))
+        except WebDriverException:
+            return False
+
+    def wait_for_inputs(self) -> bool:
+        """Wait until the calculator's input fields are interactable"""
+        from selenium.webdriver.support import expected_conditions as EC
+
+        return self._wait("inputs", EC.element_to_be_clickable(INPUT_LOCATOR))
+
+    def result_snapshot(self) -> str:
+        """Current text of the #results panel, or an empty string if it is not rendered"""
+        try:
+            elements = self.driver.find_elements(*RESULTS_LOCATOR)
+            return elements[0].text if elements else ""
+        except StaleElementReferenceException:
+            return ""
+
+    def wait_for_result_change(self, previous: str) -> bool:
+        """Wait until the #results text differs from `previous` after input"""
+        def changed(driver):
+            text = self.result_snapshot()
+            return bool(text) and text != previous
+
+        return self._wait("result", changed)
@@ -0,0 +1,90 @@
+import json
+import os
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables.json")
+
+
+class TaxTable:
+    """A tax year's bands compiled into a cumulative-tax-at-threshold index.
+
+    thresholds[i] is the taxable income where band i starts, rates[i] its
+    marginal rate and cumulative_tax[i] the tax owed at exactly that income,
+    so tax(x) is one bisect plus one multiply-add.
+    """
+
+    def __init__(self, version: str, bands: List[Dict[str, Any]], pension_rate: float, description: str = ""):
+        if not bands or bands[-1].get("width") is not None:
+            raise ValueError(f"Tax table {version} must end with an open-ended band")
+        self.version = version
+        self.description = description
+        self.pension_rate = float(pension_rate)
+
+        thresholds, rates, cumulative_tax = [], [], []
+        lower, owed = 0.0, 0.0
+        for band in bands:
+            thresholds.append(lower)
+            rates.append(float(band["rate"]))
+            cumulative_tax.append(owed)
+            if band.get("width") is not None:
+                owed += band["width"] * band["rate"]
+                lower += band["width"]
+
+        self.thresholds = thresholds
+        self.rates = rates
+        self.cumulative_tax = cumulative_tax
+        self.thresholds_array = np.array(thresholds)
+        self.rates_array = np.array(rates)
+        self.cumulative_tax_array = np.array(cumulative_tax)
+
+    def tax(self, taxable: float) -> float:
+        """Income tax on a monthly taxable income"""
+        i = bisect_left(self.thresholds, taxable)
+        if i == 0:
+            return 0.0
+        return self.cumulative_tax[i - 1] + (taxable - self.thresholds[i - 1]) * self.rates[i - 1]
+
+    def tax_batch(self, taxable: np.ndarray) -> np.ndarray:
+        """Vectorized tax(); matches it element for element"""
+        i = np.searchsorted(self.thresholds_array, taxable, side="left")
+        band = np.maximum(i - 1, 0)
+        tax = self.cumulative_tax_array[band] + (taxable - self.thresholds_array[band]) * self.rates_array[band]
+        return np.where(i > 0, tax, 0.0)
+
+    def __repr__(self):
+        return f"TaxTable({self.version!r})"
+
+
+@lru_cache(maxsize=None)
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def versions(path: str = TABLES_PATH) -> List[str]:
+    return sorted(_load(path)["tables"])
+
+
+def default_version(path: str = TABLES_PATH) -> str:
+    return _load(path)["default"]
+
+
+@lru_cache(maxsize=None)
+def get_table(version: Optional[str] = None, path: str = TABLES_PATH) -> TaxTable:
+    """Compiled tax table for version (the file's default when None), cached per process"""
+    data = _load(path)
+    version = version or data["default"]
+    try:
+        spec = data["tables"][version]
+    except KeyError:
+        raise ValueError(f"Unknown tax table version {version!r}; available: {', '.join(sorted(data['tables']))}")
+    return TaxTable(version, spec["bands"], spec["pension_rate"], spec.get("description", ""))
+
+
+DEFAULT_VERSION = default_version()
+
+__all__ = ["TaxTable", "get_table", "versions", "default_version", "DEFAULT_VERSION", "TABLES_PATH"]
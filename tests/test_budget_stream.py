@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from budget_stream import IncrementalBudgetParser, MalformedBudget
+
+
+def budget(amounts, notes="Keep an emergency fund."):
+    return json.dumps({
+        "categories": [{"name": f"Category {i}", "amount": amount, "percentage": 10} for i, amount in enumerate(amounts)],
+        "notes": notes,
+    })
+
+
+def feed_in_pieces(parser, text, size=7):
+    for start in range(0, len(text), size):
+        parser.feed(text[start:start + size])
+
+
+def test_valid_budget_streamed_in_pieces():
+    text = budget([1000, 500.5, 250])
+    parser = IncrementalBudgetParser(net_income=2000)
+    feed_in_pieces(parser, text)
+    assert parser.result() == json.loads(text)
+    assert parser.total == pytest.approx(1750.5)
+    assert len(parser.categories) == 3
+
+
+@pytest.mark.parametrize("text", [
+    "Sure! Here is your budget",
+    '{"categories": [1, 2]}',
+    '{"categories": [{"name": "Food", "amount": 10, "percentage": 1}]]',
+    '{"categories": [], "notes": "x"} trailing',
+])
+def test_structural_garbage_aborts_early(text):
+    parser = IncrementalBudgetParser(net_income=2000)
+    with pytest.raises(MalformedBudget):
+        feed_in_pieces(parser, text)
+
+
+@pytest.mark.parametrize("category", [
+    {"amount": 10, "percentage": 1},
+    {"name": "Food", "amount": "ten", "percentage": 1},
+    {"name": "Food", "amount": -5, "percentage": 1},
+])
+def test_invalid_category_aborts_when_it_closes(category):
+    parser = IncrementalBudgetParser(net_income=2000)
+    with pytest.raises(MalformedBudget):
+        parser.feed('{"categories": [' + json.dumps(category) + ",")
+
+
+def test_overspend_aborts_before_the_stream_ends():
+    parser = IncrementalBudgetParser(net_income=1000, overspend=0.10)
+    text = budget([600, 600, 10])
+    with pytest.raises(MalformedBudget):
+        feed_in_pieces(parser, text)
+    assert len(parser.categories) == 2
+    assert parser.text != text
+
+
+def test_too_many_categories():
+    parser = IncrementalBudgetParser(net_income=100000, max_categories=3)
+    with pytest.raises(MalformedBudget):
+        feed_in_pieces(parser, budget([1, 1, 1, 1]))
+
+
+def test_overlong_string_aborts_while_streaming():
+    parser = IncrementalBudgetParser(net_income=2000, max_string_length=50)
+    parser.feed('{"categories": [{"name": "' + "x" * 50)
+    with pytest.raises(MalformedBudget):
+        parser.feed("x")
+
+
+def test_overlong_notes_abort():
+    parser = IncrementalBudgetParser(net_income=2000, max_string_length=100)
+    with pytest.raises(MalformedBudget):
+        feed_in_pieces(parser, budget([100], notes="a" * 101))
+
+
+def test_string_at_the_length_limit_is_accepted():
+    parser = IncrementalBudgetParser(net_income=2000, max_string_length=100)
+    feed_in_pieces(parser, budget([100], notes="a" * 99))
+    assert parser.result()["notes"] == "a" * 99
+
+
+def test_unclosed_object_is_malformed():
+    parser = IncrementalBudgetParser(net_income=2000)
+    parser.feed('{"categories": [')
+    with pytest.raises(MalformedBudget):
+        parser.result()
+
+
+def test_result_reports_invalid_json_as_malformed_budget():
+    # Balanced and made of allowed characters, but not JSON
+    parser = IncrementalBudgetParser(net_income=2000)
+    parser.feed('{"notes": "x", "categories": [], "total": 1.2.3}')
+    with pytest.raises(MalformedBudget):
+        parser.result()
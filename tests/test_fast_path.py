@@ -0,0 +1,46 @@
+import pytest
+
+import agent
+
+ROW = {"id": 1, "salary": 3000, "allowances": 0, "tax_relief": 0}
+
+
+@pytest.fixture
+def tax_agent(tmp_path):
+    return agent.GhanaTaxAgent(result_cache=False, incremental_reports=False,
+                               locator_cache_path=str(tmp_path / "locators.json"))
+
+
+def read(text, changed=True, located=True, missing=()):
+    return {"text": text, "changed": changed, "located": located, "missing": list(missing), "wait_ms": 0}
+
+
+def scrape(tax_agent, monkeypatch, results, scenarios):
+    monkeypatch.setattr(agent, "fill_and_read", lambda *args: results)
+    return tax_agent._scrape_fast(scenarios)
+
+
+def test_changed_located_results_are_trusted(tax_agent, monkeypatch):
+    results = [read("GHS 2,400.00"), read("GHS 3,100.50")]
+    assert scrape(tax_agent, monkeypatch, results, [ROW, dict(ROW, salary=4000)]) == ["2400.00", "3100.50"]
+
+
+def test_repeated_inputs_reuse_a_trusted_read(tax_agent, monkeypatch):
+    results = [read("GHS 2,400.00"), read("GHS 2,400.00", changed=False)]
+    assert scrape(tax_agent, monkeypatch, results, [ROW, dict(ROW)]) == ["2400.00", "2400.00"]
+
+
+def test_repeated_inputs_after_a_rejected_read_are_not_trusted(tax_agent, monkeypatch):
+    # The first read never changed, so the repeat of its stale text must not be trusted either
+    results = [read("GHS 99,999.00", changed=False), read("GHS 99,999.00", changed=False)]
+    assert scrape(tax_agent, monkeypatch, results, [ROW, dict(ROW)]) == [None, None]
+
+
+def test_unchanged_result_for_new_inputs_is_not_trusted(tax_agent, monkeypatch):
+    results = [read("GHS 2,400.00"), read("GHS 2,400.00", changed=False)]
+    assert scrape(tax_agent, monkeypatch, results, [ROW, dict(ROW, salary=4000)]) == ["2400.00", None]
+
+
+def test_page_text_and_missing_fields_are_not_trusted(tax_agent, monkeypatch):
+    results = [read("Menu 2024 GHS 99999", located=False), read("GHS 2,400.00", missing=["salary"])]
+    assert scrape(tax_agent, monkeypatch, results, [ROW, dict(ROW, salary=4000)]) == [None, None]
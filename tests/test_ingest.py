@@ -0,0 +1,89 @@
+import gzip
+import json
+
+import pytest
+
+from ingest import MalformedRow, _normalize, iter_scenario_chunks, iter_scenarios
+
+
+def write_jsonl(path, rows):
+    path.write_text("\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows) + "\n")
+    return str(path)
+
+
+def test_csv_rows_are_normalized(tmp_path):
+    path = tmp_path / "scenarios.csv"
+    path.write_text('id,salary,allowances,tax_relief\n1,"3,000",500,\nemp-2,4000,,100\n')
+    assert list(iter_scenarios(str(path))) == [
+        {"id": 1, "salary": 3000.0, "allowances": 500.0, "tax_relief": 0.0},
+        {"id": "emp-2", "salary": 4000.0, "allowances": 0.0, "tax_relief": 100.0},
+    ]
+
+
+def test_gzip_jsonl_is_chunked(tmp_path):
+    path = tmp_path / "scenarios.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write("\n".join(json.dumps({"salary": 1000 + i}) for i in range(5)))
+    chunks = list(iter_scenario_chunks(str(path), chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [scenario["id"] for chunk in chunks for scenario in chunk] == [1, 2, 3, 4, 5]
+
+
+def test_malformed_rows_are_skipped_and_reported(tmp_path):
+    path = write_jsonl(tmp_path / "scenarios.jsonl", [
+        {"id": 1, "salary": 3000},
+        "{not json",
+        {"id": 3},
+        {"id": 4, "salary": "lots"},
+        {"id": 5, "salary": -1},
+        [1, 2],
+        {"id": 7, "salary": 5000},
+    ])
+    errors = []
+    scenarios = list(iter_scenarios(path, on_error=errors.append))
+    assert [scenario["id"] for scenario in scenarios] == [1, 7]
+    assert [error.line_no for error in errors] == [2, 3, 4, 5, 6]
+
+
+def test_csv_row_with_too_many_columns(tmp_path):
+    path = tmp_path / "scenarios.csv"
+    path.write_text("id,salary\n1,3000,extra\n2,4000\n")
+    errors = []
+    assert [scenario["id"] for scenario in iter_scenarios(str(path), on_error=errors.append)] == [2]
+    assert errors[0].reason == "too many columns"
+
+
+@pytest.mark.parametrize("salary", ["inf", "-inf", "nan", "1e400"])
+def test_non_finite_amounts_are_malformed(salary):
+    with pytest.raises(MalformedRow):
+        _normalize({"salary": salary}, 1)
+
+
+@pytest.mark.parametrize("raw, expected", [("7", 7), (7, 7), (7.0, 7), (1.7, 1.7), ("1.5", "1.5"), ("emp-1", "emp-1")])
+def test_only_integral_ids_become_ints(raw, expected):
+    scenario_id = _normalize({"id": raw, "salary": 1000}, 1)["id"]
+    assert scenario_id == expected and type(scenario_id) is type(expected)
+
+
+def test_missing_id_falls_back_to_line_number():
+    assert _normalize({"salary": 1000}, 42)["id"] == 42
+
+
+def test_known_tax_table_is_kept():
+    assert _normalize({"salary": 1000, "tax_table": " 2024 "}, 1)["tax_table"] == "2024"
+
+
+def test_unknown_tax_table_is_malformed(tmp_path):
+    path = write_jsonl(tmp_path / "scenarios.jsonl", [
+        {"id": 1, "salary": 3000, "tax_table": "1999"},
+        {"id": 2, "salary": 3000, "tax_table": "2023"},
+    ])
+    errors = []
+    assert [scenario["id"] for scenario in iter_scenarios(path, on_error=errors.append)] == [2]
+    assert "1999" in errors[0].reason
+
+
+def test_chunk_size_must_be_positive(tmp_path):
+    path = write_jsonl(tmp_path / "scenarios.jsonl", [{"salary": 1}])
+    with pytest.raises(ValueError):
+        list(iter_scenario_chunks(path, chunk_size=0))
@@ -0,0 +1,68 @@
+from reports.manifest import BuildManifest, report_digest
+
+STATE = {
+    "scenario_id": 1, "salary": 3000.0, "allowances": 500.0, "tax_relief": 0.0, "net_income": 2900.0,
+    "budget": {"categories": [{"name": "Food", "amount": 500, "percentage": 17.2}], "notes": "ok"},
+}
+
+
+def built(tmp_path, name):
+    path = tmp_path / name
+    path.write_bytes(b"%PDF")
+    return str(path)
+
+
+def test_digest_covers_report_fields_and_renderer():
+    digest = report_digest(STATE)
+    assert report_digest(dict(STATE, error="ignored")) == digest
+    assert report_digest(dict(STATE, net_income=2901.0)) != digest
+    assert report_digest(STATE, renderer="canvas") != digest
+
+
+def test_unchanged_report_is_skipped_after_reload(tmp_path):
+    manifest_path = str(tmp_path / ".build_manifest.json")
+    report = built(tmp_path, "budget_case1.pdf")
+    manifest = BuildManifest(manifest_path)
+    assert not manifest.is_current(report, report_digest(STATE))
+    manifest.record(report, report_digest(STATE))
+    manifest.save()
+
+    reloaded = BuildManifest(manifest_path)
+    assert reloaded.is_current(report, report_digest(STATE))
+    assert not reloaded.is_current(report, report_digest(dict(STATE, salary=3100.0)))
+    assert reloaded.stats() == {"built": 0, "skipped": 1, "removed": 0}
+
+
+def test_missing_file_or_force_rebuilds(tmp_path):
+    manifest_path = str(tmp_path / ".build_manifest.json")
+    report = built(tmp_path, "budget_case1.pdf")
+    manifest = BuildManifest(manifest_path)
+    manifest.record(report, report_digest(STATE))
+    manifest.save()
+
+    assert not BuildManifest(manifest_path, force=True).is_current(report, report_digest(STATE))
+    (tmp_path / "budget_case1.pdf").unlink()
+    assert not BuildManifest(manifest_path).is_current(report, report_digest(STATE))
+
+
+def test_prune_removes_only_reports_not_seen_this_run(tmp_path):
+    manifest_path = str(tmp_path / ".build_manifest.json")
+    kept, stale = built(tmp_path, "budget_case1.pdf"), built(tmp_path, "budget_case2.pdf")
+    manifest = BuildManifest(manifest_path)
+    manifest.record(kept, "a")
+    manifest.record(stale, "b")
+    manifest.save()
+
+    manifest = BuildManifest(manifest_path)
+    manifest.is_current(kept, "a")
+    assert manifest.prune() == [stale]
+    assert (tmp_path / "budget_case1.pdf").exists()
+    assert not (tmp_path / "budget_case2.pdf").exists()
+    manifest.save()
+    assert BuildManifest(manifest_path).prune() == [kept]
+
+
+def test_unreadable_manifest_is_ignored(tmp_path):
+    manifest_path = tmp_path / ".build_manifest.json"
+    manifest_path.write_text("{broken")
+    assert not BuildManifest(str(manifest_path)).is_current(built(tmp_path, "budget_case1.pdf"), "a")
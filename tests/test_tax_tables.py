@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from tax_tables import TaxTable, get_table, versions
+
+
+def cascade_tax(taxable):
+    """The hard-coded 2023 bracket cascade the tax tables replaced"""
+    tax = 0
+    if taxable > 0:
+        if taxable > 402:
+            tax += min(taxable - 402, 108) * 0.05
+        if taxable > 510:
+            tax += min(taxable - 510, 130) * 0.10
+        if taxable > 640:
+            tax += min(taxable - 640, 3000) * 0.175
+        if taxable > 3640:
+            tax += min(taxable - 3640, 16472) * 0.25
+        if taxable > 20112:
+            tax += (taxable - 20112) * 0.30
+    return tax
+
+
+TAXABLE = [-500, 0, 1, 401.99, 402, 402.01, 510, 640, 1000, 3640, 3640.5, 20112, 20113, 55000.75]
+
+
+@pytest.mark.parametrize("taxable", TAXABLE)
+def test_2023_table_matches_the_old_cascade(taxable):
+    assert get_table("2023").tax(taxable) == pytest.approx(cascade_tax(taxable), abs=1e-9)
+
+
+def test_tax_batch_matches_tax():
+    rng = np.random.default_rng(0)
+    taxable = np.concatenate([TAXABLE, rng.uniform(-1000, 80000, 5000)])
+    for version in versions():
+        table = get_table(version)
+        expected = np.array([table.tax(x) for x in taxable])
+        np.testing.assert_allclose(table.tax_batch(taxable), expected, rtol=0, atol=1e-9)
+
+
+def test_2023_batch_matches_the_old_cascade():
+    taxable = np.linspace(-100, 60000, 20001)
+    np.testing.assert_allclose(get_table("2023").tax_batch(taxable), [cascade_tax(x) for x in taxable],
+                               rtol=0, atol=1e-9)
+
+
+def test_default_table():
+    assert get_table().version == get_table(None).version == "2023"
+
+
+def test_unknown_version():
+    with pytest.raises(ValueError):
+        get_table("1999")
+
+
+def test_table_must_end_open_ended():
+    with pytest.raises(ValueError):
+        TaxTable("bad", [{"width": 100, "rate": 0.1}], pension_rate=0.055)